@@ -5,11 +5,22 @@ Corrige tous les fichiers .lua du répertoire courant (récursivement)
 Affiche les modifications effectuées dans chaque fichier
 """
 
+import hashlib
+import json
+import os
+import re
 import subprocess
 import sys
-import difflib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    # cydifflib est un remplaçant direct de difflib, nettement plus rapide
+    from cydifflib import unified_diff
+except ImportError:
+    from difflib import unified_diff
+
 # Codes couleurs ANSI
 RED = '\033[0;31m'
 GREEN = '\033[0;32m'
@@ -26,55 +37,141 @@ def find_lua_files():
     current_dir = Path('.')
     return list(current_dir.rglob('*.lua'))
 
-def apply_stylua_and_show_changes(lua_files):
-    """Applique StyLua et affiche les modifications"""
-    for lua_file in lua_files:
-        try:
-            # Lire le contenu original avec encodage UTF-8
-            with open(lua_file, 'r', encoding='utf-8') as f:
-                original_content = f.readlines()
-        except UnicodeDecodeError:
-            print(f"{RED}Erreur d'encodage pour {lua_file}. Tentative avec un autre encodage...{NC}")
-            try:
-                with open(lua_file, 'r', encoding='latin1') as f:
-                    original_content = f.readlines()
-            except Exception as e:
-                print(f"{RED}Impossible de lire {lua_file}: {e}{NC}")
-                continue
-
-        # Appliquer StyLua pour corriger le fichier
-        try:
-            result = subprocess.run(['.\\stylua.exe', str(lua_file)],
-                                  capture_output=False,
-                                  text=False)
-            if result.returncode != 0:
+# Verrou pour éviter que les sorties des différents threads se mélangent
+_print_lock = threading.Lock()
+
+# Cache hash -> fichier déjà conforme, pour sauter les fichiers inchangés
+# d'une exécution à l'autre
+CACHE_PATH = Path('.fix_lua_cache.json')
+_cache = {}
+
+def _load_cache():
+    """Charge le cache des fichiers déjà formatés"""
+    try:
+        with open(CACHE_PATH, 'r', encoding='utf-8') as f:
+            _cache.update(json.load(f))
+    except (OSError, ValueError):
+        pass
+
+def _save_cache():
+    """Écrit le cache des fichiers formatés"""
+    try:
+        with open(CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(_cache, f, indent=1)
+    except OSError:
+        pass
+
+def _decode_lines(data):
+    """Décode des octets Lua en lignes, UTF-8 avec repli latin1"""
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError:
+        text = data.decode('latin1')
+    return text.splitlines(keepends=True)
+
+# En-tête de hunk unifié : @@ -début[,nb] +début[,nb] @@
+_HUNK_HEADER_RE = re.compile(r'@@ -(\d+)((?:,\d+)?) \+(\d+)((?:,\d+)?) @@')
+
+def _trimmed_diff(lua_file, original_content, corrected_content):
+    """Diff unifié limité à la zone réellement modifiée.
+
+    StyLua ne touche en général que quelques lignes : on retire d'abord le
+    préfixe et le suffixe communs (comparaisons C rapides) pour n'envoyer à
+    difflib que la tranche modifiée, au lieu du fichier entier. Les numéros
+    de lignes des hunks sont ensuite recalés sur le fichier complet.
+    """
+    if original_content == corrected_content:
+        return []
+
+    start = 0
+    min_len = min(len(original_content), len(corrected_content))
+    while start < min_len and original_content[start] == corrected_content[start]:
+        start += 1
+
+    end_orig = len(original_content)
+    end_corr = len(corrected_content)
+    while end_orig > start and end_corr > start \
+            and original_content[end_orig - 1] == corrected_content[end_corr - 1]:
+        end_orig -= 1
+        end_corr -= 1
+
+    # Garder quelques lignes de contexte autour de la zone modifiée
+    context = 3
+    start = max(0, start - context)
+    end_orig = min(len(original_content), end_orig + context)
+    end_corr = min(len(corrected_content), end_corr + context)
+
+    diff = unified_diff(
+        original_content[start:end_orig], corrected_content[start:end_corr],
+        fromfile=str(lua_file),
+        tofile=f'{lua_file} (corrigé)',
+        lineterm='')
+    if start == 0:
+        return list(diff)
+
+    # difflib ne voit que la tranche : décaler les en-têtes de hunk du
+    # nombre de lignes du préfixe commun retiré (identique des deux côtés)
+    def _shift(match):
+        return '@@ -{}{} +{}{} @@'.format(
+            int(match.group(1)) + start, match.group(2),
+            int(match.group(3)) + start, match.group(4))
+
+    return [_HUNK_HEADER_RE.sub(_shift, line, count=1) if line.startswith('@@') else line
+            for line in diff]
+
+def _process_one(lua_file):
+    """Formate un fichier via le pipe stdin/stdout de StyLua.
+
+    Le contenu original part sur stdin et le résultat est capturé sur
+    stdout : pas de réécriture par StyLua ni de relecture du fichier.
+    Le disque n'est touché que si le contenu a réellement changé.
+    """
+    try:
+        original = lua_file.read_bytes()
+    except Exception as e:
+        with _print_lock:
+            print(f"{RED}Impossible de lire {lua_file}: {e}{NC}")
+        return
+
+    # Fichier déjà conforme lors d'une exécution précédente : rien à faire
+    file_hash = hashlib.sha1(original).hexdigest()
+    if _cache.get(str(lua_file)) == file_hash:
+        return
+
+    try:
+        result = subprocess.run(['.\\stylua.exe', '--stdin-filepath', str(lua_file), '-'],
+                              input=original,
+                              capture_output=True)
+        if result.returncode != 0:
+            with _print_lock:
                 print(f"{RED}Erreur lors de la correction de {lua_file}{NC}")
-                continue
-
-            # Lire le contenu corrigé avec encodage UTF-8
-            try:
-                with open(lua_file, 'r', encoding='utf-8') as f:
-                    corrected_content = f.readlines()
-            except UnicodeDecodeError:
-                with open(lua_file, 'r', encoding='latin1') as f:
-                    corrected_content = f.readlines()
-
-            # Comparer et afficher les différences
-            diff = difflib.unified_diff(
-                original_content, corrected_content,
-                fromfile=str(lua_file),
-                tofile=f'{lua_file} (corrigé)',
-                lineterm='')
-
-            diff_list = list(diff)
-            if diff_list:
+            return
+
+        corrected = result.stdout
+        if corrected == original:
+            _cache[str(lua_file)] = file_hash
+            return
+
+        lua_file.write_bytes(corrected)
+        _cache[str(lua_file)] = hashlib.sha1(corrected).hexdigest()
+
+        # Comparer et afficher les différences
+        diff_list = _trimmed_diff(lua_file, _decode_lines(original), _decode_lines(corrected))
+        if diff_list:
+            with _print_lock:
                 print(f"{YELLOW}Modifications dans {lua_file}:{NC}")
                 print('\n'.join(diff_list))
                 print("-" * 50)
 
-        except Exception as e:
+    except Exception as e:
+        with _print_lock:
             print(f"{RED}Erreur lors de la correction de {lua_file}: {e}{NC}")
 
+def apply_stylua_and_show_changes(lua_files):
+    """Applique StyLua en parallèle et affiche les modifications"""
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(_process_one, lua_files))
+
 def main():
     # Vérifier si StyLua est présent dans le répertoire courant
     if not check_stylua_installed():
@@ -95,7 +192,9 @@ def main():
     print(f"{YELLOW}Application de StyLua et affichage des modifications...{NC}\n")
 
     # Appliquer StyLua et afficher les modifications
+    _load_cache()
     apply_stylua_and_show_changes(lua_files)
+    _save_cache()
 
     print(f"\n{GREEN}✓ Correction terminée avec succès!{NC}")
 
@@ -13,15 +13,56 @@ or
 Handles multi-line strings, Lua concatenations using `..`, and variable concatenations.
 Generates:
     - TranslatedStrings_en.txt
+    - TranslatedStrings_<lang>.txt for each language passed on the command line,
+      e.g.:  python3 translation.py fr de it es
 -------------------------------------------------------------------------------
 """
+import functools
+import hashlib
+import io
+import json
+import mmap
 import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # ---------------------------------------------------------------------------
 # 1. Extraction logic
 # ---------------------------------------------------------------------------
 
+# Precompiled once at import; these run for every LOC occurrence
+_LOC_OPEN_RE = re.compile(r'LOC\s*(?:\(\s*|\s)"')
+_KEY_RE = re.compile(r'(\$\$\$/[^=]++)=')
+
+# Precompiled once at import; clean_value runs on every extracted string
+_CARET_RE = re.compile(r'\^(\d+)')
+
+# Regex-driven value extraction, matched entirely inside the C engine:
+# a double-quoted run up to its closing quote, then any number of '..'
+# continuations in either quote style. The possessive *+ (Python 3.11+)
+# forbids backtracking into the value, keeping matching linear
+_VALUE_PART_RE = re.compile(r'((?:[^"\\]|\\.)*+)"')
+_CONCAT_NEXT_RE = re.compile(r'\s*\.\.\s*(?:"((?:[^"\\]|\\.)*+)"|\'((?:[^\'\\]|\\.)*+)\')')
+
+# Escape sequences recognized by the scanner, decoded in a single pass
+_ESCAPE_MAP = {'n': '\n', 't': '\t', '"': '"', '\\': '\\'}
+_ESCAPE_RE = re.compile(r'\\(.)')
+
+# Single-quoted Lua strings only decode \' and \n, like the scanner
+_SQ_ESCAPE_RE = re.compile(r"\\(['n])")
+
+
+def _unescape(raw):
+    """Decode \\n, \\t, \\\" and \\\\ exactly like the character scanner."""
+    return _ESCAPE_RE.sub(lambda m: _ESCAPE_MAP.get(m.group(1), m.group(0)), raw)
+
+
+def _unescape_single(raw):
+    """Decode the escapes the scanner recognizes inside '...' strings."""
+    return _SQ_ESCAPE_RE.sub(lambda m: '\n' if m.group(1) == 'n' else "'", raw)
+
+
 def extract_loc_strings(text):
     """
     Extract LOC strings handling multi-line concatenations with ..
@@ -31,31 +72,58 @@ def extract_loc_strings(text):
     
     pos = 0
     while pos < len(text):
-        # Look for LOC( followed by "
-        loc_match = re.search(r'LOC\s*\(\s*"', text[pos:])
+        # Look for LOC( followed by ", or the bare form LOC " — one fused
+        # alternation so the text is scanned a single time for both.
+        # Searching from pos avoids copying the tail of the text each
+        # iteration (quadratic on large files)
+        loc_match = _LOC_OPEN_RE.search(text, pos)
         if not loc_match:
             break
-        
+
         # Move to position RIGHT AFTER the opening quote
-        after_quote = pos + loc_match.end()
-        
-        # Now check if we have $$/key= right after the quote
-        lookahead = text[after_quote:after_quote+500]
-        key_match = re.match(r'(\$\$\$/[^=]+)=', lookahead)
-        
+        after_quote = loc_match.end()
+
+        # Now check if we have $$/key= right after the quote; the endpos
+        # bound replaces the old 500-char lookahead slice
+        key_match = _KEY_RE.match(text, after_quote, after_quote + 500)
+
         if not key_match:
             # Not a translation string, move on
             pos = after_quote
             continue
-        
+
         # Found a valid LOC with key
         key = key_match.group(1).strip()
-        
+
         # The value starts right after the = sign
-        value_start = after_quote + key_match.end()
-        
-        # Extract the complete value (handling multi-line and concatenations)
-        value, next_pos = extract_complete_value(text, value_start, key)
+        value_start = key_match.end()
+
+        # Regex-driven extraction: grab the first quoted run, then consume
+        # any '..' continuations in either quote style. A chain broken by
+        # a variable/expression simply stops matching, like the scanner
+        part = _VALUE_PART_RE.match(text, value_start)
+        if part:
+            pieces = [_unescape(part.group(1))]
+            end = part.end()
+            while True:
+                cont = _CONCAT_NEXT_RE.match(text, end)
+                if not cont:
+                    break
+                if cont.group(1) is not None:
+                    pieces.append(_unescape(cont.group(1)))
+                else:
+                    pieces.append(_unescape_single(cont.group(2)))
+                end = cont.end()
+
+            value = clean_value(''.join(pieces))
+            if value:
+                results.append((key, value))
+            pos = end
+            continue
+
+        # Robust fallback: hand-written scanner for values the regex
+        # cannot terminate (e.g. an unclosed string)
+        value, next_pos = extract_complete_value(text, value_start)
         
         if value:
             results.append((key, value))
@@ -66,7 +134,7 @@ def extract_loc_strings(text):
     return results
 
 
-def extract_complete_value(text, start_pos, key=""):
+def extract_complete_value(text, start_pos):
     """
     Extract a complete LOC value starting from position after the '=' sign.
     The value is already inside the opened quote from LOC("$$/key=VALUE")
@@ -74,156 +142,137 @@ def extract_complete_value(text, start_pos, key=""):
     """
     value_parts = []
     pos = start_pos
-    debug = "SpeciesGuessInfo" in key
     should_stop = False  # Flag to stop both loops
-    
-    if debug:
-        print(f"\n  📍 Starting extraction at position {pos}")
-    
-    # Read characters until we hit the closing quote
+
+    # Read runs of ordinary characters, jumping straight to the next
+    # escape or quote with C-level str.find instead of stepping per byte
     chars = []
-    iteration = 0
     while pos < len(text) and not should_stop:
-        iteration += 1
-        if debug and iteration <= 10:
-            print(f"    Iter {iteration}: pos={pos}, char='{text[pos] if pos < len(text) else 'EOF'}'")
-        
-        # Check flag at start of each iteration
-        if should_stop:
-            if debug:
-                print(f"    should_stop flag detected, breaking")
+        next_quote = text.find('"', pos)
+        next_escape = text.find('\\', pos)
+
+        # Unterminated string: keep the rest and stop
+        if next_quote == -1 and next_escape == -1:
+            chars.append(text[pos:])
+            pos = len(text)
             break
-        
-        char = text[pos]
-        
+
         # Handle escape sequences
-        if char == '\\' and pos + 1 < len(text):
-            next_char = text[pos + 1]
-            if next_char == 'n':
-                chars.append('\n')
-                pos += 2
-                continue
-            elif next_char == 't':
-                chars.append('\t')
+        if next_escape != -1 and (next_quote == -1 or next_escape < next_quote):
+            if next_escape > pos:
+                chars.append(text[pos:next_escape])
+            pos = next_escape
+            if pos + 1 < len(text) and text[pos + 1] in _ESCAPE_MAP:
+                chars.append(_ESCAPE_MAP[text[pos + 1]])
                 pos += 2
-                continue
-            elif next_char == '"':
-                chars.append('"')
-                pos += 2
-                continue
-            elif next_char == '\\':
-                chars.append('\\')
-                pos += 2
-                continue
             else:
-                chars.append(char)
+                chars.append('\\')
                 pos += 1
-                continue
-        
+            continue
+
         # Closing quote - this is the end of the current string part
-        if char == '"':
-            # Save what we have so far
-            if chars:
-                value_parts.append(''.join(chars))
-                chars = []
-            
-            pos += 1  # Skip the closing quote
-            
-            # Now look ahead: skip whitespace and check what's next
+        if next_quote > pos:
+            chars.append(text[pos:next_quote])
+        pos = next_quote
+
+        # Save what we have so far
+        if chars:
+            value_parts.append(''.join(chars))
+            chars = []
+
+        pos += 1  # Skip the closing quote
+
+        # Now look ahead: skip whitespace and check what's next
+        while pos < len(text) and text[pos] in ' \t\n\r':
+            pos += 1
+
+        if pos >= len(text):
+            break
+
+        # Check for end of LOC parameters FIRST (before checking concatenation)
+        if text[pos] in ',)':
+            break
+
+        # Check for concatenation operator ..
+        if pos + 1 < len(text) and text[pos:pos+2] == '..':
+
+            pos += 2
+
+            # Skip whitespace after ..
             while pos < len(text) and text[pos] in ' \t\n\r':
                 pos += 1
-            
+
             if pos >= len(text):
                 break
-            
-            # Check for end of LOC parameters FIRST (before checking concatenation)
-            if text[pos] in ',)':
-                break
-            
-            # Check for concatenation operator ..
-            if pos + 1 < len(text) and text[pos:pos+2] == '..':
-                
-                pos += 2
-                
-                # Skip whitespace after ..
-                while pos < len(text) and text[pos] in ' \t\n\r':
-                    pos += 1
-                
-                if pos >= len(text):
-                    break
-                
-                next_char = text[pos]
-                
-                # Check if next is a quoted string
-                if next_char == '"':
-                    pos += 1  # Skip opening quote of next part
-                    continue  # Continue reading
-                elif next_char == "'":
-                    # Single-quoted string in Lua
-                    pos += 1
-                    # Read until closing single quote
-                    single_chars = []
-                    while pos < len(text):
-                        if text[pos] == '\\' and pos + 1 < len(text):
-                            # Handle escapes
-                            if text[pos + 1] == "'":
-                                single_chars.append("'")
-                                pos += 2
-                                continue
-                            elif text[pos + 1] == 'n':
-                                single_chars.append('\n')
-                                pos += 2
-                                continue
-                        if text[pos] == "'":
+
+            next_char = text[pos]
+
+            # Check if next is a quoted string
+            if next_char == '"':
+                pos += 1  # Skip opening quote of next part
+                continue  # Continue reading
+            elif next_char == "'":
+                # Single-quoted string in Lua
+                pos += 1
+                # Read until closing single quote
+                single_chars = []
+                while pos < len(text):
+                    if text[pos] == '\\' and pos + 1 < len(text):
+                        # Handle escapes
+                        if text[pos + 1] == "'":
+                            single_chars.append("'")
+                            pos += 2
+                            continue
+                        elif text[pos + 1] == 'n':
+                            single_chars.append('\n')
+                            pos += 2
+                            continue
+                    if text[pos] == "'":
+                        pos += 1
+                        if single_chars:
+                            part = ''.join(single_chars)
+                            value_parts.append(part)
+                            single_chars = []
+                        # After single quote, check for more concatenation
+                        while pos < len(text) and text[pos] in ' \t\n\r':
                             pos += 1
-                            if single_chars:
-                                part = ''.join(single_chars)
-                                value_parts.append(part)
-                                single_chars = []
-                            # After single quote, check for more concatenation
+
+                        # CRITICAL: Check for end markers FIRST
+                        if pos < len(text) and text[pos] in ',)':
+                            # This is the end of the LOC string value
+                            should_stop = True
+                            break
+
+                        if pos + 1 < len(text) and text[pos:pos+2] == '..':
+                            pos += 2
                             while pos < len(text) and text[pos] in ' \t\n\r':
                                 pos += 1
-                            
-                            # CRITICAL: Check for end markers FIRST
-                            if pos < len(text) and text[pos] in ',)':
-                                # This is the end of the LOC string value
-                                should_stop = True
-                                break
-                            
-                            if pos + 1 < len(text) and text[pos:pos+2] == '..':
-                                pos += 2
-                                while pos < len(text) and text[pos] in ' \t\n\r':
+                            if pos < len(text):
+                                next_after_concat = text[pos]
+                                if next_after_concat == '"':
                                     pos += 1
-                                if pos < len(text):
-                                    next_after_concat = text[pos]
-                                    if next_after_concat == '"':
-                                        pos += 1
-                                        break  # Back to main loop to read double-quoted string
-                                    elif next_after_concat == "'":
-                                        # Stay in this loop to read another single-quoted string
-                                        pos += 1
-                                        single_chars = []
-                                        continue
-                            # No more concat after single quote, stop
-                            break
-                        single_chars.append(text[pos])
-                        pos += 1
-                    # After exiting single-quote loop, check if we should stop
-                    if should_stop:
-                        break  # Exit the main loop too
-                    # Otherwise continue to read more in main loop
-                    continue
-                else:
-                    # Concatenation with variable/expression, stop here
-                    break
+                                    break  # Back to main loop to read double-quoted string
+                                elif next_after_concat == "'":
+                                    # Stay in this loop to read another single-quoted string
+                                    pos += 1
+                                    single_chars = []
+                                    continue
+                        # No more concat after single quote, stop
+                        break
+                    single_chars.append(text[pos])
+                    pos += 1
+                # After exiting single-quote loop, check if we should stop
+                if should_stop:
+                    break  # Exit the main loop too
+                # Otherwise continue to read more in main loop
+                continue
             else:
-                # No more concatenation, end of value
+                # Concatenation with variable/expression, stop here
                 break
         else:
-            # Regular character
-            chars.append(char)
-            pos += 1
-    
+            # No more concatenation, end of value
+            break
+
     # Don't forget remaining chars
     if chars:
         value_parts.append(''.join(chars))
@@ -237,23 +286,25 @@ def extract_complete_value(text, start_pos, key=""):
     return None, pos
 
 
+@functools.lru_cache(maxsize=65536)
 def clean_value(value):
     """
     Clean extracted value:
     - Replace Lua placeholders ^1, ^2 with {1}, {2}
     - Normalize whitespace (but preserve intentional newlines)
     """
-    # Replace ^N with {N}
-    value = re.sub(r'\^(\d+)', r'{\1}', value)
-    
-    # Split by newlines to handle each line
-    lines = value.split('\n')
+    # Replace ^N with {N}; most values carry no placeholder, so the
+    # substitution only runs when a caret is actually present (a plain
+    # ^1..^9 replace chain would corrupt multi-digit placeholders)
+    if '^' in value:
+        value = _CARET_RE.sub(r'{\1}', value)
+
     cleaned_lines = []
-    
-    for line in lines:
-        # Collapse multiple spaces/tabs to single space
-        line = re.sub(r'[ \t]+', ' ', line)
-        line = line.strip()
+
+    for line in value.split('\n'):
+        # split()/join collapses whitespace runs and strips in C code,
+        # several times faster than a per-line regex substitution
+        line = ' '.join(line.split())
         if line:
             cleaned_lines.append(line)
     
@@ -275,68 +326,274 @@ def format_translation(key, value):
 
 
 # ---------------------------------------------------------------------------
-# 2. Main processing
+# 2. Translation logic
+# ---------------------------------------------------------------------------
+
+# Sentinel used to pack many values into a single translation request
+_BATCH_SEPARATOR = "\n~~~\n"
+
+# Disk cache of previous translations so re-runs only pay for new strings;
+# keys are "<lang>\0<sha1 of English value>"
+_CACHE_FILENAME = ".translation_cache.json"
+_translation_cache = {}
+
+
+def _cache_key(value, target_lang):
+    return target_lang + "\0" + hashlib.sha1(value.encode("utf-8")).hexdigest()
+
+
+def _load_translation_cache(current_dir):
+    try:
+        with open(os.path.join(current_dir, _CACHE_FILENAME), "r", encoding="utf-8") as f:
+            _translation_cache.update(json.load(f))
+    except (OSError, ValueError):
+        pass
+
+
+def _save_translation_cache(current_dir):
+    try:
+        with open(os.path.join(current_dir, _CACHE_FILENAME), "w", encoding="utf-8") as f:
+            json.dump(_translation_cache, f, ensure_ascii=False)
+    except OSError as e:
+        print(f"  ⚠️  Could not save translation cache: {e}")
+
+
+def _is_translatable(value):
+    """Placeholders, numbers and punctuation-only values need no translation."""
+    return len(value) >= 2 and any(c.isalpha() for c in value)
+
+
+def _write_if_changed(output_path, new_text):
+    """
+    Write new_text to output_path only when the content differs.
+    Skipping identical rewrites keeps timestamps stable and avoids
+    file-watcher/CI churn on unchanged re-runs.
+    """
+    new_bytes = new_text.encode("utf-8")
+    new_hash = hashlib.blake2b(new_bytes, digest_size=16).digest()
+    try:
+        with open(output_path, "rb") as f:
+            if hashlib.blake2b(f.read(), digest_size=16).digest() == new_hash:
+                return False
+    except OSError:
+        pass
+    # Binary mode: text was already encoded once (for hashing) and no
+    # newline translation happens, matching newline="" semantics. A wide
+    # buffer lets the whole file land in a single OS write.
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        f.write(new_bytes)
+    return True
+
+
+def translate_values(values, target_lang):
+    """
+    Translate a list of English values to target_lang.
+    Each distinct value is translated exactly once (repeated strings are
+    very common across plugin files), cached hits are served from the
+    on-disk cache, and the remaining misses go out in as few requests
+    as possible.
+    """
+    # Translate each distinct value once, then fan results back out
+    unique_values = list(dict.fromkeys(values))
+    translated_by_value = {}
+    misses = []
+    for value in unique_values:
+        # Values like "{1}", "..." or "1.0" come back unchanged anyway
+        if not _is_translatable(value):
+            translated_by_value[value] = value
+            continue
+        cached = _translation_cache.get(_cache_key(value, target_lang))
+        if cached is not None:
+            translated_by_value[value] = cached
+        else:
+            misses.append(value)
+
+    if misses:
+        # Optional dependency, installed from requirements.txt by the
+        # workflow; only needed when something actually has to go out
+        from deep_translator import GoogleTranslator
+
+        translator = GoogleTranslator(source="en", target=target_lang)
+        for value, text in zip(misses, _translate_unique(misses, translator, target_lang)):
+            if text is None:
+                # Translation failed: ship the English text for this run
+                # but leave the cache empty so a later run retries it
+                translated_by_value[value] = value
+            else:
+                translated_by_value[value] = text
+                _translation_cache[_cache_key(value, target_lang)] = text
+
+    return [translated_by_value[value] for value in values]
+
+
+def _translate_unique(values, translator, target_lang):
+    """Send a list of distinct values through the translator."""
+    # Preferred path: a single batched call for the whole list
+    try:
+        translated = translator.translate_batch(values)
+        if translated and len(translated) == len(values):
+            return translated
+    except Exception as e:
+        print(f"  ⚠️  Batch translation to '{target_lang}' failed: {e}")
+
+    # Fallback: join with a sentinel, translate once, split back
+    try:
+        joined = translator.translate(_BATCH_SEPARATOR.join(values))
+        parts = [p.strip() for p in joined.split("~~~")]
+        if len(parts) == len(values):
+            return parts
+    except Exception as e:
+        print(f"  ⚠️  Joined translation to '{target_lang}' failed: {e}")
+
+    # Last resort: translate item by item; failures come back as None so
+    # the caller can fall back to the original without caching it
+    translated = []
+    for value in values:
+        try:
+            translated.append(translator.translate(value))
+        except Exception:
+            translated.append(None)
+    return translated
+
+
+def generate_language_file(current_dir, target_lang, work):
+    """
+    Generate TranslatedStrings_<lang>.txt mirroring the English layout.
+    `work` is the list of unique (filename, key, value) triples collected
+    while the English file was emitted.
+    """
+    print(f"\n🌍 Translating to '{target_lang}'...")
+
+    translated = translate_values([value for _, _, value in work], target_lang)
+
+    output_path = os.path.join(current_dir, f"TranslatedStrings_{target_lang}.txt")
+    out = io.StringIO()
+    current_file = None
+    for (filename, key, _), text in zip(work, translated):
+        if filename != current_file:
+            if current_file is not None:
+                out.write("\n")
+            out.write(f"# {filename}\n")
+            current_file = filename
+        out.write(f'"{key}={text}"\n')
+    out.write("\n")
+
+    if _write_if_changed(output_path, out.getvalue()):
+        print(f"✅ File generated: {output_path}")
+    else:
+        print(f"✅ File unchanged: {output_path}")
+
+
+# ---------------------------------------------------------------------------
+# 3. Main processing
 # ---------------------------------------------------------------------------
 
-def process_lua_files():
-    """Extract and generate English translation file from current directory."""
+def _extract_one(path):
+    """
+    Read one Lua file and extract its LOC strings.
+    Module-level so it can run in a ProcessPoolExecutor worker; returns
+    (filename, matches, error) so per-file failures do not abort the run.
+    """
+    filename = os.path.basename(path)
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return filename, [], None
+            # Map the file instead of copying it into a bytes object; the
+            # LOC prefilter then scans the page cache directly and files
+            # without translations are never materialized in Python
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # mmap has no __contains__, so `b"LOC" in mm` would compare
+                # the pattern against each byte (int) and never match
+                if mm.find(b"LOC") == -1:
+                    return filename, [], None
+                content = mm[:].decode("utf-8", errors="ignore")
+        return filename, extract_loc_strings(content), None
+    except Exception as e:
+        return filename, [], str(e)
+
+
+def process_lua_files(languages=None):
+    """Extract and generate translation files from current directory."""
     current_dir = os.getcwd()
     print(f"🔍 Scanning Lua files in: {current_dir}")
     
     seen_translations = {}
     translations_by_file = {}
     
-    lua_files = [f for f in os.listdir(current_dir) if f.lower().endswith(".lua")]
-    print(f"Found {len(lua_files)} .lua files\n")
-    
-    # Process all files
-    for filename in sorted(lua_files):
-        path = os.path.join(current_dir, filename)
-        
-        try:
-            with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-            
-            matches = extract_loc_strings(content)
-            
-            if matches:
+    # scandir caches is_file() in the DirEntry, avoiding a stat per file
+    with os.scandir(current_dir) as it:
+        lua_entries = sorted(
+            (e for e in it if e.is_file() and e.name.endswith((".lua", ".LUA", ".Lua"))),
+            key=lambda e: e.name,
+        )
+    print(f"Found {len(lua_entries)} .lua files\n")
+
+    # Extraction is CPU-bound in the regex engine, so fan out across
+    # cores; chunksize amortizes IPC overhead over many small files
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(_extract_one, [e.path for e in lua_entries], chunksize=8)
+        for filename, matches, error in results:
+            if error:
+                print(f"  ⚠️  Error reading {filename}: {error}")
+            elif matches:
                 translations_by_file[filename] = matches
                 print(f"  📄 {filename}: {len(matches)} strings extracted")
-                    
-        except Exception as e:
-            print(f"  ⚠️  Error reading {filename}: {e}")
     
     if not translations_by_file:
         print("\n⚠️  No translation strings found.")
         return
     
-    # Generate output file
+    # Generate output file, streaming lines as they are produced; collect
+    # the unique (filename, key, value) triples for the translation pass
+    # here instead of re-deriving them for every target language
     output_path = os.path.join(current_dir, "TranslatedStrings_en.txt")
-    output_lines = []
-    
-    for filename, translations in translations_by_file.items():
-        output_lines.append(f"# {filename}")
-        
-        for key, value in translations:
-            line = format_translation(key, value)
-            
-            if key in seen_translations:
-                if seen_translations[key] == value:
-                    output_lines.append(f"# DUPLICATE: {line}")
+    work = []
+
+    with io.StringIO() as out:
+        for filename, translations in translations_by_file.items():
+            out.write(f"# {filename}\n")
+
+            for key, value in translations:
+                line = format_translation(key, value)
+
+                # One probe instead of a membership test plus lookups;
+                # extracted values are never None so get() is unambiguous
+                prev = seen_translations.get(key)
+                if prev is None:
+                    out.write(line + "\n")
+                    seen_translations[key] = value
+                    work.append((filename, key, value))
+                elif prev == value:
+                    out.write(f"# DUPLICATE: {line}\n")
                 else:
-                    output_lines.append(f"# CONFLICT: {line}")
-                    output_lines.append(f"# PREVIOUS: \"{key}={seen_translations[key]}\"")
-            else:
-                output_lines.append(line)
-                seen_translations[key] = value
-        
-        output_lines.append("")
-    
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(output_lines))
-    
-    print(f"\n✅ File generated: {output_path}")
+                    out.write(f"# CONFLICT: {line}\n")
+                    out.write(f"# PREVIOUS: \"{key}={prev}\"\n")
+
+            out.write("\n")
+
+        if _write_if_changed(output_path, out.getvalue()):
+            print(f"\n✅ File generated: {output_path}")
+        else:
+            print(f"\n✅ File unchanged: {output_path}")
     print(f"📊 Total unique translations: {len(seen_translations)}")
+
+    # Generate translated files for any requested target languages in
+    # parallel — each language is an independent batch of network calls
+    target_langs = [lang for lang in (languages or []) if lang != "en"]
+    if target_langs:
+        _load_translation_cache(current_dir)
+        with ThreadPoolExecutor(max_workers=min(8, len(target_langs))) as executor:
+            futures = [
+                (lang, executor.submit(generate_language_file, current_dir, lang, work))
+                for lang in target_langs
+            ]
+            for lang, future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"  ⚠️  Translation to '{lang}' failed: {e}")
+        _save_translation_cache(current_dir)
     
     # Show some examples
     print("\n📋 Sample extractions:")
@@ -347,8 +604,8 @@ def process_lua_files():
 
 
 # ---------------------------------------------------------------------------
-# 3. Entry point
+# 4. Entry point
 # ---------------------------------------------------------------------------
 
 if __name__ == "__main__":
-    process_lua_files()
\ No newline at end of file
+    process_lua_files([lang.lower() for lang in sys.argv[1:]])
\ No newline at end of file